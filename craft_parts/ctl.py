@@ -77,8 +77,11 @@ def _client(cmd: str, args: list[str]) -> str | None:
     data = {"function": cmd, "args": args}
     ctl_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     ctl_socket.connect(ctl_socket_path)
-    ctl_socket.send(bytes(json.dumps(data), encoding="utf8"))
-    feedback = ctl_socket.recv(1024).decode("utf8").split(" ", 1)
+    ctl_socket.sendall(bytes(json.dumps(data) + "\n", encoding="utf8"))
+    # Signal the end of the request, the server closes the connection
+    # once the reply is sent.
+    ctl_socket.shutdown(socket.SHUT_WR)
+    feedback = _recv_response(ctl_socket).decode("utf8").split(" ", 1)
 
     # response from server is in the form "<status> <message>" where
     # <status> can be either "OK" or "ERR".  Previous server versions
@@ -101,6 +104,23 @@ def _client(cmd: str, args: list[str]) -> str | None:
     return retval
 
 
+def _recv_response(ctl_socket: socket.socket) -> bytes:
+    """Receive the response from the step processor.
+
+    The response may span multiple lines, it ends when the step processor
+    closes the connection.
+
+    :param ctl_socket: The socket connected to the step processor.
+
+    :return: The response.
+    """
+    chunks: list[bytes] = []
+    while chunk := ctl_socket.recv(65536):
+        chunks.append(chunk)
+
+    return b"".join(chunks)
+
+
 def main() -> None:
     """Run the ctl client cli."""
     if len(sys.argv) < 2:  # noqa: PLR2004
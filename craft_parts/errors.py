@@ -19,9 +19,9 @@
 from __future__ import annotations
 
 import abc
-import contextlib
-from io import StringIO
-from typing import TYPE_CHECKING
+import copyreg
+import functools
+from typing import TYPE_CHECKING, Any
 
 from typing_extensions import override
 
@@ -34,17 +34,83 @@ if TYPE_CHECKING:
     from pydantic_core import ErrorDetails
 
 
+def _format_loc(loc: tuple[int | str, ...]) -> str:
+    """Format a pydantic error location."""
+    loc_parts: list[str] = []
+    for loc_part in loc:
+        # Pydantic locations only contain plain strings and integers.
+        if type(loc_part) is str:
+            loc_parts.append(loc_part)
+        else:
+            # Integer indicates an index. Fix up the previous part in place.
+            loc_parts[-1] = f"{loc_parts[-1]}[{loc_part}]"
+
+    loc_str = ".".join(loc_parts)
+
+    # Filter out internal __root__ detail.
+    if ".__root__" in loc_str:
+        return loc_str.replace(".__root__", "")
+    return loc_str
+
+
+def _format_validation_error(loc: tuple[int | str, ...], msg: str) -> str:
+    """Format a single pydantic error as a list entry."""
+    field = _format_loc(loc)
+    if msg == "field required":
+        return f"- field {field!r} is required"
+    if msg == "extra fields not permitted":
+        return f"- extra field {field!r} not permitted"
+    return f"- {msg} in field {field!r}"
+
+
+@functools.lru_cache(maxsize=128)
+def _humanize_build_attributes(attributes: frozenset[str]) -> str:
+    """Format a set of build attributes, reusing previous results."""
+    return humanize_list(attributes, "and")
+
+
+@functools.lru_cache(maxsize=256)
+def _review_part_resolution(part_name: str) -> str:
+    """Get the resolution message asking to review a part."""
+    return f"Review part {part_name!r} and make sure it's correct."
+
+
+def _format_file_list(file_names: Iterable[str]) -> str:
+    """Format file names as a sorted list with one indented name per line."""
+    sorted_names = sorted(file_names)
+    if not sorted_names:
+        return ""
+    return "    " + "\n    ".join(sorted_names)
+
+
 class PartsError(Exception):
     """Unexpected error.
 
+    The string representations of an error are formatted once and reused until
+    its brief, details, resolution or documentation slug change.
+
     :param brief: Brief description of error.
     :param details: Detailed information.
     :param resolution: Recommendation, if any.
     :param doc_slug:
         Reusable documentation slug for consumers adopting
         the Craft Parts documentation.
+
+    :ivar details: Further details on the error.
     """
 
+    __slots__ = (
+        "brief",
+        "details",
+        "resolution",
+        "doc_slug",
+        "_str_cache",
+        "_repr_cache",
+    )
+
+    # Fields the string representations are formatted from.
+    _MESSAGE_FIELDS = frozenset({"brief", "details", "resolution", "doc_slug"})
+
     def __init__(
         self,
         brief: str,
@@ -53,40 +119,74 @@ class PartsError(Exception):
         doc_slug: str | None = None,
     ) -> None:
         self.brief = brief
-        self._details = details
+        self.details = details
         self.resolution = resolution
         self.doc_slug = doc_slug
+        self._str_cache: str | None = None
+        self._repr_cache: str | None = None
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        super().__setattr__(name, value)
+        if name in self._MESSAGE_FIELDS:
+            # Drop messages formatted with the previous values.
+            super().__setattr__("_str_cache", None)
+            super().__setattr__("_repr_cache", None)
 
     def __str__(self) -> str:
-        components = [self.brief]
+        # Errors are rarely modified after creation, format the message once.
+        if self._str_cache is None:
+            self._str_cache = self._format_str()
+        return self._str_cache
 
-        if self.details:
-            components.append(self.details)
+    def _format_str(self) -> str:
+        details = self.details
+        resolution = self.resolution
 
-        if self.resolution:
-            components.append(self.resolution)
+        # Most errors only have a brief, avoid building a list to join.
+        if not details and not resolution:
+            return self.brief
 
-        return "\n".join(components)
+        if not details:
+            return f"{self.brief}\n{resolution}"
+
+        if not resolution:
+            return f"{self.brief}\n{details}"
+
+        return f"{self.brief}\n{details}\n{resolution}"
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(brief={self.brief!r}, details={self.details!r}, resolution={self.resolution!r}, doc_slug={self.doc_slug!r})"
+        if self._repr_cache is None:
+            self._repr_cache = f"{self.__class__.__name__}(brief={self.brief!r}, details={self.details!r}, resolution={self.resolution!r}, doc_slug={self.doc_slug!r})"
+        return self._repr_cache
 
-    @property
-    def details(self) -> str | None:
-        """Further details on the error."""
-        return self._details
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Subclass constructors don't take the stored attributes as arguments,
+        # so create the instance without calling __init__ and restore them.
+        state = dict(self.__dict__)
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+
+        return copyreg.__newobj__, (type(self), *self.args), state  # type: ignore[attr-defined]
 
 
 class FeatureError(PartsError):
     """A feature is not configured as expected."""
 
+    __slots__ = ()
+
     def __init__(self, message: str, details: str | None = None) -> None:
-        self.message = message
         brief = message
         resolution = "This operation cannot be executed."
 
         super().__init__(brief=brief, details=details, resolution=resolution)
 
+    @property
+    def message(self) -> str:
+        """The error message."""
+        return self.brief
+
 
 class PartDependencyCycle(PartsError):  # noqa: N818
     """A dependency cycle has been detected in the parts definition.
@@ -94,16 +194,20 @@ class PartDependencyCycle(PartsError):  # noqa: N818
     :param part_names: The names of the parts involved in the cycle.
     """
 
-    def __init__(self, *, part_names: list[str] | None = None) -> None:
-        brief = "A circular dependency chain was detected."
-        resolution = "Review the parts definition to remove dependency cycles."
+    __slots__ = ()
 
+    _BRIEF = "A circular dependency chain was detected."
+    _RESOLUTION = "Review the parts definition to remove dependency cycles."
+
+    def __init__(self, *, part_names: list[str] | None = None) -> None:
         if part_names:
             details = f"Part processing order: {' -> '.join(part_names)}"
         else:
             details = None
 
-        super().__init__(brief=brief, details=details, resolution=resolution)
+        super().__init__(
+            brief=self._BRIEF, details=details, resolution=self._RESOLUTION
+        )
 
 
 class InvalidApplicationName(PartsError):  # noqa: N818
@@ -112,6 +216,8 @@ class InvalidApplicationName(PartsError):  # noqa: N818
     :param name: The invalid application name.
     """
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str) -> None:
         self.name = name
         brief = f"Application name {name!r} is invalid."
@@ -129,6 +235,8 @@ class InvalidPartName(PartsError):  # noqa: N818
     :param part_name: The invalid part name.
     """
 
+    __slots__ = ("part_name",)
+
     def __init__(self, part_name: str) -> None:
         self.part_name = part_name
         brief = f"A part named {part_name!r} is not defined in the parts list."
@@ -143,6 +251,8 @@ class InvalidArchitecture(PartsError):  # noqa: N818
     :param arch_name: The unsupported architecture name.
     """
 
+    __slots__ = ("arch_name",)
+
     def __init__(self, arch_name: str) -> None:
         self.arch_name = arch_name
         brief = f"Architecture {arch_name!r} is not supported."
@@ -158,15 +268,21 @@ class PartSpecificationError(PartsError):
     :param message: The error message.
     """
 
+    __slots__ = ("part_name",)
+
     def __init__(self, *, part_name: str, message: str) -> None:
         self.part_name = part_name
-        self.message = message
         brief = f"Part {part_name!r} validation failed."
         details = message
-        resolution = f"Review part {part_name!r} and make sure it's correct."
+        resolution = _review_part_resolution(part_name)
 
         super().__init__(brief=brief, details=details, resolution=resolution)
 
+    @property
+    def message(self) -> str:
+        """The error message."""
+        return self.details or ""
+
     @classmethod
     def from_validation_error(
         cls, *, part_name: str, error_list: list[ErrorDetails]
@@ -176,42 +292,13 @@ class PartSpecificationError(PartsError):
         :param part_name: The name of the part being processed.
         :param error_list: A list of dictionaries containing pydantic error definitions.
         """
-        formatted_errors: list[str] = []
-
-        for error in error_list:
-            loc = error["loc"]
-            msg = error["msg"]
-
-            if not loc or not msg:
-                continue
-
-            field = cls._format_loc(loc)
-            if msg == "field required":
-                formatted_errors.append(f"- field {field!r} is required")
-            elif msg == "extra fields not permitted":
-                formatted_errors.append(f"- extra field {field!r} not permitted")
-            else:
-                formatted_errors.append(f"- {msg} in field {field!r}")
+        message = "\n".join(
+            _format_validation_error(error["loc"], error["msg"])
+            for error in error_list
+            if error["loc"] and error["msg"]
+        )
 
-        return cls(part_name=part_name, message="\n".join(formatted_errors))
-
-    @classmethod
-    def _format_loc(cls, loc: tuple[int | str, ...]) -> str:
-        """Format location."""
-        loc_parts: list[str] = []
-        for loc_part in loc:
-            if isinstance(loc_part, str):
-                loc_parts.append(loc_part)
-            else:
-                # Integer indicates an index. Go back and fix up previous part.
-                previous_part = loc_parts.pop()
-                previous_part += f"[{loc_part}]"
-                loc_parts.append(previous_part)
-
-        loc_str = ".".join(loc_parts)
-
-        # Filter out internal __root__ detail.
-        return loc_str.replace(".__root__", "")
+        return cls(part_name=part_name, message=message)
 
 
 class CopyTreeError(PartsError):
@@ -220,6 +307,8 @@ class CopyTreeError(PartsError):
     :param message: The error message.
     """
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str) -> None:
         self.message = message
         brief = f"Failed to copy or link file tree: {message}."
@@ -234,6 +323,8 @@ class CopyFileNotFound(PartsError):  # noqa: N818
     :param name: The file name.
     """
 
+    __slots__ = ("name",)
+
     def __init__(self, name: str) -> None:
         self.name = name
         brief = f"Failed to copy {name!r}: no such file or directory."
@@ -250,6 +341,8 @@ class XAttributeError(PartsError):
     :param is_write: Whether this is an attribute write operation.
     """
 
+    __slots__ = ("key", "path", "is_write")
+
     def __init__(
         self,
         key: str,
@@ -276,6 +369,8 @@ class XAttributeTooLong(PartsError):  # noqa: N818
     :param path: The file path.
     """
 
+    __slots__ = ("key", "value", "path")
+
     def __init__(self, key: str, value: str, path: str) -> None:
         self.key = key
         self.value = value
@@ -292,10 +387,12 @@ class UndefinedPlugin(PartsError):  # noqa: N818
     :param part_name: The name of the part with no plugin definition.
     """
 
+    __slots__ = ("part_name",)
+
     def __init__(self, *, part_name: str) -> None:
         self.part_name = part_name
         brief = f"Plugin not defined for part {part_name!r}."
-        resolution = f"Review part {part_name!r} and make sure it's correct."
+        resolution = _review_part_resolution(part_name)
 
         super().__init__(brief=brief, resolution=resolution)
 
@@ -307,11 +404,13 @@ class InvalidPlugin(PartsError):  # noqa: N818
     :param part_name: The name of the part defining the invalid plugin.
     """
 
+    __slots__ = ("plugin_name", "part_name")
+
     def __init__(self, plugin_name: str, *, part_name: str) -> None:
         self.plugin_name = plugin_name
         self.part_name = part_name
         brief = f"Plugin {plugin_name!r} in part {part_name!r} is not registered."
-        resolution = f"Review part {part_name!r} and make sure it's correct."
+        resolution = _review_part_resolution(part_name)
 
         super().__init__(brief=brief, resolution=resolution)
 
@@ -323,6 +422,8 @@ class PluginNotStrict(PartsError):  # noqa: N818
     :param part_name: The name of the part defining the plugin.
     """
 
+    __slots__ = ("plugin_name", "part_name")
+
     def __init__(self, plugin_name: str, *, part_name: str) -> None:
         self.plugin_name = plugin_name
         self.part_name = part_name
@@ -337,37 +438,45 @@ class PluginNotStrict(PartsError):  # noqa: N818
 class OsReleaseIdError(PartsError):
     """Failed to determine the host operating system identification string."""
 
-    def __init__(self) -> None:
-        brief = "Unable to determine the host operating system ID."
+    __slots__ = ()
 
-        super().__init__(brief=brief)
+    _BRIEF = "Unable to determine the host operating system ID."
+
+    def __init__(self) -> None:
+        super().__init__(brief=self._BRIEF)
 
 
 class OsReleaseNameError(PartsError):
     """Failed to determine the host operating system name."""
 
-    def __init__(self) -> None:
-        brief = "Unable to determine the host operating system name."
+    __slots__ = ()
 
-        super().__init__(brief=brief)
+    _BRIEF = "Unable to determine the host operating system name."
+
+    def __init__(self) -> None:
+        super().__init__(brief=self._BRIEF)
 
 
 class OsReleaseVersionIdError(PartsError):
     """Failed to determine the host operating system version."""
 
-    def __init__(self) -> None:
-        brief = "Unable to determine the host operating system version ID."
+    __slots__ = ()
 
-        super().__init__(brief=brief)
+    _BRIEF = "Unable to determine the host operating system version ID."
+
+    def __init__(self) -> None:
+        super().__init__(brief=self._BRIEF)
 
 
 class OsReleaseCodenameError(PartsError):
     """Failed to determine the host operating system version codename."""
 
-    def __init__(self) -> None:
-        brief = "Unable to determine the host operating system codename."
+    __slots__ = ()
 
-        super().__init__(brief=brief)
+    _BRIEF = "Unable to determine the host operating system codename."
+
+    def __init__(self) -> None:
+        super().__init__(brief=self._BRIEF)
 
 
 class FilesetError(PartsError):
@@ -377,6 +486,8 @@ class FilesetError(PartsError):
     :param message: The error message.
     """
 
+    __slots__ = ("name", "message")
+
     def __init__(self, *, name: str, message: str) -> None:
         self.name = name
         self.message = message
@@ -392,12 +503,16 @@ class FilesetConflict(PartsError):  # noqa: N818
     :param conflicting_files: A set containing the conflicting file names.
     """
 
+    __slots__ = ("conflicting_files",)
+
     def __init__(self, conflicting_files: set[str]) -> None:
         self.conflicting_files = conflicting_files
+        # Sort the names so the message doesn't depend on set iteration order.
+        file_names = ", ".join(repr(name) for name in sorted(conflicting_files))
         brief = "Failed to filter files: inconsistent 'stage' and 'prime' filesets."
         details = (
             f"The following files have been excluded in the 'stage' fileset, "
-            f"but included by the 'prime' fileset: {conflicting_files!r}."
+            f"but included by the 'prime' fileset: {{{file_names}}}."
         )
         resolution = (
             "Make sure that the files included in 'prime' are also included in 'stage'."
@@ -413,6 +528,8 @@ class FileOrganizeError(PartsError):
     :param message: The error message.
     """
 
+    __slots__ = ("part_name", "message")
+
     def __init__(self, *, part_name: str, message: str) -> None:
         self.part_name = part_name
         self.message = message
@@ -430,6 +547,8 @@ class PartFilesConflict(PartsError):  # noqa: N818
     :param partition: Optional name of the partition where the conflict occurred.
     """
 
+    __slots__ = ("part_name", "other_part_name", "conflicting_files", "partition")
+
     def __init__(
         self,
         *,
@@ -443,8 +562,7 @@ class PartFilesConflict(PartsError):  # noqa: N818
         self.conflicting_files = conflicting_files
         self.partition = partition
 
-        indented_conflicting_files = (f"    {i}" for i in conflicting_files)
-        file_paths = "\n".join(sorted(indented_conflicting_files))
+        file_paths = _format_file_list(conflicting_files)
         partition_info = f" for the {partition!r} partition" if partition else ""
         brief = (
             "Failed to stage: parts list the same file "
@@ -462,6 +580,8 @@ class PartFilesConflict(PartsError):  # noqa: N818
 class OverlayStageConflict(PartsError):  # noqa: N818
     """A conflict between contents to be staged from the overlay and from the build step."""
 
+    __slots__ = ("part_name", "overlay_part_name", "conflicting_files", "partition")
+
     def __init__(
         self,
         *,
@@ -475,8 +595,7 @@ class OverlayStageConflict(PartsError):  # noqa: N818
         self.conflicting_files = conflicting_files
         self.partition = partition
 
-        indented_conflicting_files = (f"    {i}" for i in conflicting_files)
-        file_paths = "\n".join(sorted(indented_conflicting_files))
+        file_paths = _format_file_list(conflicting_files)
         partition_info = f" for the {partition!r} partition" if partition else ""
         brief = (
             "Failed to stage: parts list the same file or directory "
@@ -498,11 +617,12 @@ class StageFilesConflict(PartsError):  # noqa: N818
     :param conflicting_files: The list of confictling files.
     """
 
+    __slots__ = ("part_name", "conflicting_files")
+
     def __init__(self, *, part_name: str, conflicting_files: list[str]) -> None:
         self.part_name = part_name
         self.conflicting_files = conflicting_files
-        indented_conflicting_files = (f"    {i}" for i in conflicting_files)
-        file_paths = "\n".join(sorted(indented_conflicting_files))
+        file_paths = _format_file_list(conflicting_files)
         brief = "Failed to stage: part files conflict with files already being staged."
         details = (
             f"The following files in part {part_name!r} are already being staged "
@@ -519,6 +639,8 @@ class PluginEnvironmentValidationError(PartsError):
     :param part_name: The name of the part being processed.
     """
 
+    __slots__ = ("part_name", "reason")
+
     def __init__(self, *, part_name: str, reason: str) -> None:
         self.part_name = part_name
         self.reason = reason
@@ -533,6 +655,8 @@ class PluginPullError(PartsError):
     :param part_name: The name of the part being processed.
     """
 
+    __slots__ = ("part_name",)
+
     def __init__(self, *, part_name: str) -> None:
         self.part_name = part_name
         brief = f"Failed to run the pull script for part {part_name!r}."
@@ -547,10 +671,13 @@ class UserExecutionError(PartsError, abc.ABC):
     :param plugin_name: The name of the plugin being processed.
     """
 
+    __slots__ = ("stderr", "_details_cache")
+
     def __init__(
         self, *, brief: str, resolution: str, stderr: bytes | None = None
     ) -> None:
         self.stderr = stderr
+        self._details_cache: str | None = None
         super().__init__(
             brief=brief, resolution=resolution, doc_slug="/reference/plugins/"
         )
@@ -562,28 +689,38 @@ class UserExecutionError(PartsError, abc.ABC):
 
         Displays the last three trace lines from the error output.
         """
-        if self.stderr is None:
-            return None
+        if self._details_cache is None and self.stderr is not None:
+            self._details_cache = self._format_stderr(self.stderr)
+        return self._details_cache
 
-        stderr = self.stderr.decode("utf-8", errors="replace")
-        stderr_lines = list(filter(lambda x: x, stderr.split("\n")))
+    @details.setter
+    def details(self, value: str | None) -> None:
+        self._details_cache = value
 
-        # Find the third trace output line
+    @staticmethod
+    def _format_stderr(stderr: bytes) -> str:
+        # Split the raw output, only the lines being displayed are decoded.
+        stderr_lines = [line for line in stderr.split(b"\n") if line]
+
+        # Find the third trace output line. Output that can't hold more
+        # trace lines than the ones to display is shown in full.
         anchor_line = 0
         traced_lines_to_display = 3
-        count = 0
-        for idx, line in enumerate(reversed(stderr_lines)):
-            if line.startswith("+"):
-                count += 1
-                if count > traced_lines_to_display:
-                    anchor_line = -idx
-                    break
-
-        with contextlib.closing(StringIO()) as details_io:
-            for line in stderr_lines[anchor_line:]:
-                details_io.write(f"\n:: {line}")
-
-            return details_io.getvalue()
+        if len(stderr_lines) > traced_lines_to_display:
+            count = 0
+            for idx, line in enumerate(reversed(stderr_lines)):
+                if line.startswith(b"+"):
+                    count += 1
+                    if count > traced_lines_to_display:
+                        anchor_line = -idx
+                        break
+
+        return "".join(
+            [
+                f"\n:: {line.decode('utf-8', errors='replace')}"
+                for line in stderr_lines[anchor_line:]
+            ]
+        )
 
 
 class PluginBuildError(UserExecutionError):
@@ -594,6 +731,8 @@ class PluginBuildError(UserExecutionError):
     :param stderr: The contents of the build execution error.
     """
 
+    __slots__ = ("part_name", "plugin_name")
+
     def __init__(
         self, *, part_name: str, plugin_name: str, stderr: bytes | None = None
     ) -> None:
@@ -611,6 +750,8 @@ class PluginCleanError(PartsError):
     :param part_name: The name of the part being processed.
     """
 
+    __slots__ = ("part_name",)
+
     def __init__(self, *, part_name: str) -> None:
         self.part_name = part_name
         brief = f"Failed to run the clean script for part {part_name!r}."
@@ -626,6 +767,8 @@ class InvalidControlAPICall(PartsError):  # noqa: N818
     :param message: The error message.
     """
 
+    __slots__ = ("part_name", "scriptlet_name", "message")
+
     def __init__(self, *, part_name: str, scriptlet_name: str, message: str) -> None:
         self.part_name = part_name
         self.scriptlet_name = scriptlet_name
@@ -648,6 +791,8 @@ class ScriptletRunError(UserExecutionError):
     :param stderr: The contents of the scriptlet execution error.
     """
 
+    __slots__ = ("part_name", "scriptlet_name", "exit_code")
+
     def __init__(
         self,
         *,
@@ -673,6 +818,8 @@ class CallbackRegistrationError(PartsError):
     :param message: the error message.
     """
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str) -> None:
         self.message = message
         brief = f"Callback registration error: {message}."
@@ -687,6 +834,8 @@ class StagePackageNotFound(PartsError):  # noqa: N818
     :param package_name: The name of the package.
     """
 
+    __slots__ = ("part_name", "package_name")
+
     def __init__(self, *, part_name: str, package_name: str) -> None:
         self.part_name = part_name
         self.package_name = package_name
@@ -702,6 +851,8 @@ class OverlayPackageNotFound(PartsError):  # noqa: N818
     :param message: the error message.
     """
 
+    __slots__ = ("part_name", "package_name")
+
     def __init__(self, *, part_name: str, package_name: str) -> None:
         self.part_name = part_name
         self.package_name = package_name
@@ -716,6 +867,8 @@ class InvalidAction(PartsError):  # noqa: N818
     :param message: The error message.
     """
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str) -> None:
         self.message = message
         brief = f"Action is invalid: {message}."
@@ -726,24 +879,30 @@ class InvalidAction(PartsError):  # noqa: N818
 class OverlayPlatformError(PartsError):
     """A project using overlays was processed on a non-Linux platform."""
 
-    def __init__(self) -> None:
-        brief = "The overlay step is only supported on Linux."
+    __slots__ = ()
 
-        super().__init__(brief=brief)
+    _BRIEF = "The overlay step is only supported on Linux."
+
+    def __init__(self) -> None:
+        super().__init__(brief=self._BRIEF)
 
 
 class OverlayPermissionError(PartsError):
     """A project using overlays was processed by a non-privileged user."""
 
-    def __init__(self) -> None:
-        brief = "Using the overlay step requires superuser privileges."
+    __slots__ = ()
 
-        super().__init__(brief=brief)
+    _BRIEF = "Using the overlay step requires superuser privileges."
+
+    def __init__(self) -> None:
+        super().__init__(brief=self._BRIEF)
 
 
 class DebError(PartsError):
     """A "deb"-related command failed."""
 
+    __slots__ = ()
+
     def __init__(
         self, deb_path: pathlib.Path, command: list[str], exit_code: int
     ) -> None:
@@ -759,6 +918,8 @@ class DebError(PartsError):
 class PartitionError(PartsError):
     """Errors related to partitions."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         brief: str,
@@ -777,6 +938,8 @@ class PartitionUsageError(PartitionError):
     :param brief: Override brief message.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         error_list: Iterable[str],
@@ -800,6 +963,8 @@ class PartitionUsageWarning(PartitionError, Warning):  # noqa: N818
     :param warning_list: Iterable of strings describing the misuses.
     """
 
+    __slots__ = ()
+
     def __init__(self, warning_list: Iterable[str]) -> None:
         super().__init__(
             brief="Possible misuse of partitions",
@@ -823,6 +988,8 @@ class PartitionNotFound(PartitionUsageError):  # noqa: N818
     :param partitions: Iterable of the names of valid partitions.
     """
 
+    __slots__ = ("partition_name",)
+
     def __init__(self, partition_name: str, partitions: Iterable[str]) -> None:
         # Allow callers catching this exception easy access to the partition name
         self.partition_name = partition_name
@@ -836,6 +1003,8 @@ class PartitionNotFound(PartitionUsageError):  # noqa: N818
 class FilesystemMountError(PartsError):
     """Errors related to filesystem mounts."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         brief: str,
@@ -853,52 +1022,23 @@ class FilesystemMountError(PartsError):
 
         :param error_list: A list of dictionaries containing pydantic error definitions.
         """
-        formatted_errors: list[str] = []
-
-        for error in error_list:
-            loc = error["loc"]
-            msg = error["msg"]
-
-            if not msg:
-                continue
-
-            field = cls._format_loc(loc)
-            if msg == "field required":
-                formatted_errors.append(f"- field {field!r} is required")
-            elif msg == "extra fields not permitted":
-                formatted_errors.append(f"- extra field {field!r} not permitted")
-            else:
-                formatted_errors.append(f"- {msg} in field {field!r}")
-
-        return cls(
-            brief="Filesystem validation failed.", details="\n".join(formatted_errors)
+        details = "\n".join(
+            _format_validation_error(error["loc"], error["msg"])
+            for error in error_list
+            if error["msg"]
         )
 
-    @classmethod
-    def _format_loc(cls, loc: tuple[int | str, ...]) -> str:
-        """Format location."""
-        loc_parts: list[str] = []
-        for loc_part in loc:
-            if isinstance(loc_part, str):
-                loc_parts.append(loc_part)
-            else:
-                # Integer indicates an index. Go back and fix up previous part.
-                previous_part = loc_parts.pop()
-                previous_part += f"[{loc_part}]"
-                loc_parts.append(previous_part)
-
-        loc_str = ".".join(loc_parts)
-
-        # Filter out internal __root__ detail.
-        return loc_str.replace(".__root__", "")
+        return cls(brief="Filesystem validation failed.", details=details)
 
 
 class UnsupportedBuildAttributesError(PartsError):
     """Use of build-attributes that a plugin does not support."""
 
+    __slots__ = ()
+
     def __init__(self, unsupported: set[str], plugin_name: str) -> None:
         noun = "build attribute" if len(unsupported) == 1 else "build attributes"
-        humanized = humanize_list(unsupported, "and")
+        humanized = _humanize_build_attributes(frozenset(unsupported))
         message = f"Plugin {plugin_name!r} does not support the {humanized} {noun}."
 
         super().__init__(
@@ -17,6 +17,7 @@
 """Definitions and helpers to handle filesets."""
 
 import os
+import stat
 from glob import iglob
 
 from craft_parts import errors, features
@@ -151,27 +152,32 @@ def migratable_filesets(
         files = {x for x in files if not x.startswith(exclude_dir + "/")}
 
     # Separate dirs from files.
-    dirs = {
-        x
-        for x in files
-        if os.path.isdir(os.path.join(srcdir, x))  # noqa: PTH112, PTH118
-        and not os.path.islink(os.path.join(srcdir, x))  # noqa: PTH114, PTH118
-    }
+    dirs = {x for x in files if _is_real_dir(os.path.join(srcdir, x))}  # noqa: PTH118
 
     # Remove dirs from files.
     files = files - dirs
 
-    # Include (resolved) parent directories for each selected file.
-    for _filename in files:
-        filename = _get_resolved_relative_path(_filename, srcdir)
+    # Files usually share parent directories, resolve each of them only once.
+    resolved_parents: dict[str, str] = {}
+    resolved_files = {
+        _get_resolved_relative_path(name, srcdir, resolved_parents) for name in files
+    }
+
+    # Include (resolved) parent directories for each selected file. Once a
+    # parent was seen, all of its own parents were already added.
+    seen_parents: set[str] = set()
+    for filename in resolved_files:
         dirname = os.path.dirname(filename)  # noqa: PTH120
-        while dirname:
-            dirs.add(dirname)
+        while dirname and dirname not in seen_parents:
+            seen_parents.add(dirname)
             dirname = os.path.dirname(dirname)  # noqa: PTH120
+    dirs |= seen_parents
 
-    # Resolve parent paths for dirs and files.
-    resolved_dirs = {_get_resolved_relative_path(dirname, srcdir) for dirname in dirs}
-    resolved_files = {_get_resolved_relative_path(name, srcdir) for name in files}
+    # Resolve parent paths for dirs.
+    resolved_dirs = {
+        _get_resolved_relative_path(dirname, srcdir, resolved_parents)
+        for dirname in dirs
+    }
 
     return resolved_files, resolved_dirs
 
@@ -260,11 +266,7 @@ def _generate_include_set(directory: str, includes: list[str]) -> set[str]:
         else:
             include_files |= {os.path.join(directory, include)}  # noqa: PTH118
 
-    include_dirs = [
-        x
-        for x in include_files
-        if os.path.isdir(x) and not os.path.islink(x)  # noqa: PTH112, PTH114
-    ]
+    include_dirs = [x for x in include_files if _is_real_dir(x)]
     include_files = {os.path.relpath(x, directory) for x in include_files}
 
     # Expand includeFiles, so that an exclude like '*/*.so' will still match
@@ -309,7 +311,27 @@ def _generate_exclude_set(
     return exclude_files, exclude_dirs
 
 
-def _get_resolved_relative_path(relative_path: str, base_directory: str) -> str:
+def _is_real_dir(path: str) -> bool:
+    """Verify if a path is a directory and not a symlink to a directory.
+
+    This is equivalent to checking ``isdir`` and ``islink``, but takes a single
+    ``lstat`` call.
+
+    :param path: The path to verify.
+
+    :return: Whether the path is a directory that is not a symlink.
+    """
+    try:
+        return stat.S_ISDIR(os.lstat(path).st_mode)
+    except (OSError, ValueError):
+        return False
+
+
+def _get_resolved_relative_path(
+    relative_path: str,
+    base_directory: str,
+    resolved_parents: dict[str, str] | None = None,
+) -> str:
     """Resolve path components against target base_directory.
 
     If the resulting target path is a symlink, it will not be followed.
@@ -318,11 +340,18 @@ def _get_resolved_relative_path(relative_path: str, base_directory: str) -> str:
 
     :param relative_path: Path of target, relative to base_directory.
     :param base_directory: Base path of target.
+    :param resolved_parents: If provided, a mapping of already resolved parent
+        paths to reuse and update.
 
     :return: Resolved path, relative to base_directory.
     """
     parent_relpath, filename = os.path.split(relative_path)
-    parent_abspath = os.path.realpath(os.path.join(base_directory, parent_relpath))  # noqa: PTH118
+    if resolved_parents is None:
+        resolved_parents = {}
+    parent_abspath = resolved_parents.get(parent_relpath)
+    if parent_abspath is None:
+        parent_abspath = os.path.realpath(os.path.join(base_directory, parent_relpath))  # noqa: PTH118
+        resolved_parents[parent_relpath] = parent_abspath
 
     filename_abspath = os.path.join(parent_abspath, filename)  # noqa: PTH118
     #  https://github.com/astral-sh/ty/issues/405
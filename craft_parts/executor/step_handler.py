@@ -16,16 +16,17 @@
 
 """Handle the execution of built-in or user specified step commands."""
 
+import concurrent.futures
 import dataclasses
-import functools
 import json
 import logging
 import os
 import selectors
 import socket
 import tempfile
+from collections.abc import Callable
 from pathlib import Path
-from typing import TextIO
+from typing import ClassVar, TextIO
 
 from craft_parts import errors, packages
 from craft_parts.infos import StepInfo
@@ -44,8 +45,13 @@ logger = logging.getLogger(__name__)
 
 Stream = TextIO | int | None
 
+_MAX_MIGRATION_WORKERS = 8
 
-@dataclasses.dataclass(frozen=True)
+_CTL_SOCKET_BACKLOG = 16
+_CTL_RECV_SIZE = 65536
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class StepPartitionContents:
     """Files and directories to be added to the step's state."""
 
@@ -53,7 +59,7 @@ class StepPartitionContents:
     dirs: set[str] = dataclasses.field(default_factory=set[str])
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class StagePartitionContents(StepPartitionContents):
     """Files and directories for both stage and backstage in the step's state."""
 
@@ -61,7 +67,11 @@ class StagePartitionContents(StepPartitionContents):
     backstage_dirs: set[str] = dataclasses.field(default_factory=set[str])
 
 
-@dataclasses.dataclass(init=False)
+_EMPTY_PARTITION_CONTENTS = StepPartitionContents()
+_EMPTY_STAGE_PARTITION_CONTENTS = StagePartitionContents()
+
+
+@dataclasses.dataclass(init=False, slots=True)
 class StepContents:
     """Contents mapped to partitions."""
 
@@ -76,14 +86,12 @@ class StepContents:
     ) -> None:
         if partitions is None or len(partitions) == 0:
             partitions = [DEFAULT_PARTITION]
-        if stage:
-            self.partitions_contents = {
-                partition: StagePartitionContents() for partition in partitions
-            }
-            return
-        self.partitions_contents = {
-            partition: StepPartitionContents() for partition in partitions
-        }
+        # Contents are replaced, never modified in place, so all partitions
+        # can share the same empty contents.
+        self.partitions_contents = dict.fromkeys(
+            partitions,
+            _EMPTY_STAGE_PARTITION_CONTENTS if stage else _EMPTY_PARTITION_CONTENTS,
+        )
 
 
 class StepHandler:
@@ -98,6 +106,14 @@ class StepHandler:
     the running instance.
     """
 
+    _BUILTIN_HANDLERS: ClassVar[dict[Step, str]] = {
+        Step.PULL: "_builtin_pull",
+        Step.OVERLAY: "_builtin_overlay",
+        Step.BUILD: "_builtin_build",
+        Step.STAGE: "_builtin_stage",
+        Step.PRIME: "_builtin_prime",
+    }
+
     def __init__(
         self,
         part: Part,
@@ -118,26 +134,17 @@ class StepHandler:
         self._stdout = stdout
         self._stderr = stderr
         self._partitions = partitions
+        self._part_run_dir = part.part_run_dir.absolute()
 
     def run_builtin(self) -> StepContents:
         """Run the built-in commands for the current step."""
-        step = self._step_info.step
-
-        if step == Step.PULL:
-            handler = self._builtin_pull
-        elif step == Step.OVERLAY:
-            handler = self._builtin_overlay
-        elif step == Step.BUILD:
-            handler = self._builtin_build
-        elif step == Step.STAGE:
-            handler = self._builtin_stage
-        elif step == Step.PRIME:
-            handler = self._builtin_prime
-        else:
+        handler_name = self._BUILTIN_HANDLERS.get(self._step_info.step)
+        if handler_name is None:
             raise RuntimeError(
                 "Request to run the built-in handler for an invalid step."
             )
 
+        handler: Callable[[], StepContents] = getattr(self, handler_name)
         return handler()
 
     def _builtin_pull(self) -> StepContents:
@@ -150,7 +157,7 @@ class StepHandler:
             try:
                 _create_and_run_script(
                     pull_commands,
-                    script_path=self._part.part_run_dir.absolute() / "pull.sh",
+                    script_path=self._part_run_dir / "pull.sh",
                     cwd=self._part.part_src_subdir,
                     stdout=self._stdout,
                     stderr=self._stderr,
@@ -171,16 +178,14 @@ class StepHandler:
         build_commands = self._plugin.get_build_commands()
 
         # save script to set the build environment
-        build_environment_script_path = (
-            self._part.part_run_dir.absolute() / "environment.sh"
-        )
-        build_environment_script_path.write_text(self._env)
+        build_environment_script_path = self._part_run_dir / "environment.sh"
+        _write_if_changed(build_environment_script_path, self._env)
         build_environment_script_path.chmod(0o644)
 
         try:
             _create_and_run_script(
                 build_commands,
-                script_path=self._part.part_run_dir.absolute() / "build.sh",
+                script_path=self._part_run_dir / "build.sh",
                 environment_script_path=build_environment_script_path,
                 cwd=self._part.part_build_subdir,
                 stdout=self._stdout,
@@ -195,18 +200,22 @@ class StepHandler:
 
         return StepContents()
 
-    def _builtin_stage(self) -> StepContents:
-        stage_fileset = Fileset(
+    def _get_stage_fileset(self) -> Fileset:
+        """Return the fileset of files to stage for this part."""
+        return Fileset(
             self._part.spec.stage_files,
             name="stage",
             default_partition=self._step_info.default_partition,
         )
 
+    def _builtin_stage(self) -> StepContents:
+        stage_fileset = self._get_stage_fileset()
+
         def pkgconfig_fixup(file_path: str) -> None:
-            if os.path.islink(file_path):  # noqa: PTH114
-                return
             if not file_path.endswith(".pc"):
                 return
+            if os.path.islink(file_path):  # noqa: PTH114
+                return
             packages.fix_pkg_config(
                 prefix_prepend=self._part.stage_dir,
                 pkg_config_file=Path(file_path),
@@ -216,32 +225,40 @@ class StepHandler:
         step_contents = StepContents(stage=True)
 
         if self._partitions:
+            default_partition = self._step_info.default_partition
+            # The install dirs mapping is rebuilt on every property access.
+            install_dirs = self._part.part_install_dirs
+            get_stage_dir = self._part.dirs.get_stage_dir
+
             backstage_files, backstage_dirs = filesets.migratable_filesets(
                 Fileset(
-                    [f"({self._step_info.default_partition})/*"],
+                    [f"({default_partition})/*"],
                     name="backstage",
-                    default_partition=self._step_info.default_partition,
+                    default_partition=default_partition,
                 ),
                 str(self._part.part_export_dir),
-                self._step_info.default_partition,
-                self._step_info.default_partition,
+                default_partition,
+                default_partition,
             )
-            for partition in self._partitions:
+
+            def stage_partition(partition: str) -> tuple[set[str], set[str]]:
+                install_dir = install_dirs[partition]
                 partition_files, partition_dirs = filesets.migratable_filesets(
-                    stage_fileset,
-                    str(self._part.part_install_dirs[partition]),
-                    self._step_info.default_partition,
-                    partition,
+                    stage_fileset, str(install_dir), default_partition, partition
                 )
-                partition_files, partition_dirs = migrate_files(
+                return migrate_files(
                     files=partition_files,
                     dirs=partition_dirs,
-                    srcdir=self._part.part_install_dirs[partition],
-                    destdir=self._part.dirs.get_stage_dir(partition),
+                    srcdir=install_dir,
+                    destdir=get_stage_dir(partition),
                     fixup_func=pkgconfig_fixup,
                 )
+
+            migrated = _migrate_partitions(stage_partition, self._partitions)
+
+            for partition, (partition_files, partition_dirs) in migrated.items():
                 # Backstage content is managed only in the default partition
-                if partition == self._step_info.default_partition:
+                if partition == default_partition:
                     backstage_files, backstage_dirs = migrate_files(
                         files=backstage_files,
                         dirs=backstage_dirs,
@@ -313,35 +330,35 @@ class StepHandler:
             prime_fileset.entries == [wildcard_default]
             or len(prime_fileset.includes) == 0
         ):
-            stage_fileset = Fileset(
-                self._part.spec.stage_files,
-                name="stage",
-                default_partition=self._step_info.default_partition,
-            )
-            prime_fileset.combine(stage_fileset)
+            prime_fileset.combine(self._get_stage_fileset())
 
         step_contents = StepContents()
 
         if self._partitions:
-            for partition in self._partitions:
+            default_partition = self._step_info.default_partition
+            install_dirs = self._part.part_install_dirs
+            get_stage_dir = self._part.dirs.get_stage_dir
+            get_prime_dir = self._part.dirs.get_prime_dir
+            permissions = self._part.spec.permissions
+
+            def prime_partition(partition: str) -> tuple[set[str], set[str]]:
                 partition_files, partition_dirs = filesets.migratable_filesets(
                     prime_fileset,
-                    str(self._part.part_install_dirs[partition]),
-                    self._step_info.default_partition,
+                    str(install_dirs[partition]),
+                    default_partition,
                     partition,
                 )
-
-                srcdir = self._part.dirs.get_stage_dir(partition)
-                destdir = self._part.dirs.get_prime_dir(partition)
-
-                partition_files, partition_dirs = migrate_files(
+                return migrate_files(
                     files=partition_files,
                     dirs=partition_dirs,
-                    srcdir=srcdir,
-                    destdir=destdir,
-                    permissions=self._part.spec.permissions,
+                    srcdir=get_stage_dir(partition),
+                    destdir=get_prime_dir(partition),
+                    permissions=permissions,
                 )
 
+            migrated = _migrate_partitions(prime_partition, self._partitions)
+
+            for partition, (partition_files, partition_dirs) in migrated.items():
                 step_contents.partitions_contents[partition] = StepPartitionContents(
                     files=partition_files, dirs=partition_dirs
                 )
@@ -382,7 +399,8 @@ class StepHandler:
             ctl_socket_path = os.path.join(tempdir, "craftctl.socket")  # noqa: PTH118
             ctl_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             ctl_socket.bind(ctl_socket_path)
-            ctl_socket.listen(1)
+            ctl_socket.setblocking(False)  # noqa: FBT003
+            ctl_socket.listen(_CTL_SOCKET_BACKLOG)
 
             selector = self._ctl_server_selector(step, scriptlet_name, ctl_socket)
 
@@ -409,50 +427,71 @@ class StepHandler:
                     stderr=process_error.result.stderr,
                 ) from process_error
             finally:
+                selector.close()
                 ctl_socket.close()
 
     def _ctl_server_selector(
         self, step: Step, scriptlet_name: str, stream: socket.socket
     ) -> selectors.BaseSelector:
-        selector = selectors.SelectSelector()
+        selector = selectors.DefaultSelector()
 
         def accept(sock: socket.socket, _mask: int) -> None:
-            conn, _ = sock.accept()
+            try:
+                conn, _ = sock.accept()
+            except BlockingIOError:
+                # The connection was dropped before it could be accepted.
+                return
+            conn.setblocking(False)  # noqa: FBT003
             selector.register(conn, selectors.EVENT_READ, read)
 
+        # Partial messages received from each connection.
+        buffers: dict[socket.socket, bytes] = {}
+
         def read(conn: socket.socket, _mask: int) -> None:
-            data = conn.recv(1024)
+            data, closed = _recv_available(conn)
             logger.debug(f"ctl server received: {data!s}")
-            if not data:
+
+            # Messages are terminated by a newline. Older clients send a single
+            # unterminated message per connection, and wait for the reply.
+            *messages, partial = (buffers.pop(conn, b"") + data).split(b"\n")
+            if partial and (closed or _is_complete_message(partial)):
+                messages.append(partial)
+                partial = b""
+
+            for message in messages:
+                if message:
+                    reply(conn, message)
+
+            if closed:
                 selector.unregister(conn)
                 conn.close()
-                return
+            elif partial:
+                buffers[conn] = partial
 
+        def reply(conn: socket.socket, message: bytes) -> None:
             try:
-                retval = self._handle_control_api(
-                    step, scriptlet_name, data.decode("utf-8")
-                )
-                conn.send((f"OK {retval!s}\n" if retval else "OK\n").encode())
+                retval = self._handle_control_api(step, scriptlet_name, message)
+                _send_reply(conn, (f"OK {retval!s}\n" if retval else "OK\n").encode())
             except errors.PluginBuildError:
                 # If craftctl default raises PluginBuildError, pass it upwards.
                 raise
             except errors.PartsError as error:
-                conn.send(f"ERR {error!s}\n".encode())
+                _send_reply(conn, f"ERR {error!s}\n".encode())
 
         selector.register(stream, selectors.EVENT_READ, accept)
 
         return selector
 
     def _handle_control_api(
-        self, step: Step, scriptlet_name: str, function_call: str
+        self, step: Step, scriptlet_name: str, function_call: bytes
     ) -> str:
         """Parse the command message received from the client."""
         try:
             function_json = json.loads(function_call)
-        except json.JSONDecodeError as err:
+        except (json.JSONDecodeError, UnicodeDecodeError) as err:
             raise RuntimeError(
                 f"{scriptlet_name!r} scriptlet called a function with invalid json: "
-                f"{function_call}"
+                f"{function_call.decode('utf-8', errors='replace')}"
             ) from err
 
         for attr in ["function", "args"]:
@@ -474,44 +513,40 @@ class StepHandler:
         """Invoke API command actions."""
         retval = ""
 
-        invalid_control_api_call = functools.partial(
-            errors.InvalidControlAPICall,
-            part_name=self._part.name,
-            scriptlet_name=scriptlet_name,
-        )
-
         if cmd_name == "default":
             if len(cmd_args) > 0:
-                raise invalid_control_api_call(
+                raise self._invalid_control_api_call(
+                    scriptlet_name,
                     message=f"invalid arguments to command {cmd_name!r}",
                 )
             self._execute_builtin_handler(step)
         elif cmd_name == "set":
             if len(cmd_args) != 1:
-                raise invalid_control_api_call(
+                raise self._invalid_control_api_call(
+                    scriptlet_name,
                     message=(f"invalid arguments to command {cmd_name!r}"),
                 )
 
             if "=" not in cmd_args[0]:
-                raise invalid_control_api_call(
+                raise self._invalid_control_api_call(
+                    scriptlet_name,
                     message=(
                         f"invalid arguments to command {cmd_name!r} (want key=value)"
                     ),
                 )
 
-            name, value = cmd_args[0].split("=")
+            name, value = cmd_args[0].split("=", 1)
 
             try:
                 self._step_info.set_project_var(name, value)
             except (ValueError, RuntimeError) as err:
-                raise errors.InvalidControlAPICall(
-                    part_name=self._part.name,
-                    scriptlet_name=scriptlet_name,
-                    message=str(err),
+                raise self._invalid_control_api_call(
+                    scriptlet_name, message=str(err)
                 ) from err
         elif cmd_name == "get":
             if len(cmd_args) != 1:
-                raise invalid_control_api_call(
+                raise self._invalid_control_api_call(
+                    scriptlet_name,
                     message=(f"invalid number of arguments to command {cmd_name!r}"),
                 )
             (name,) = cmd_args
@@ -519,29 +554,125 @@ class StepHandler:
             try:
                 retval = self._step_info.get_project_var(name, raw_read=True)
             except ValueError as err:
-                raise errors.InvalidControlAPICall(
-                    part_name=self._part.name,
-                    scriptlet_name=scriptlet_name,
-                    message=str(err),
+                raise self._invalid_control_api_call(
+                    scriptlet_name, message=str(err)
                 ) from err
         else:
-            raise invalid_control_api_call(
+            raise self._invalid_control_api_call(
+                scriptlet_name,
                 message=f"invalid command {cmd_name!r}",
             )
 
         return retval
 
+    def _invalid_control_api_call(
+        self, scriptlet_name: str, *, message: str
+    ) -> errors.InvalidControlAPICall:
+        return errors.InvalidControlAPICall(
+            part_name=self._part.name, scriptlet_name=scriptlet_name, message=message
+        )
+
     def _execute_builtin_handler(self, step: Step) -> None:
-        if step == Step.PULL:
-            self._builtin_pull()
-        elif step == Step.OVERLAY:
-            self._builtin_overlay()
-        elif step == Step.BUILD:
-            self._builtin_build()
-        elif step == Step.STAGE:
-            self._builtin_stage()
-        elif step == Step.PRIME:
-            self._builtin_prime()
+        handler_name = self._BUILTIN_HANDLERS.get(step)
+        if handler_name is not None:
+            getattr(self, handler_name)()
+
+
+def _migrate_partitions(
+    migrate: Callable[[str], tuple[set[str], set[str]]], partitions: list[str]
+) -> dict[str, tuple[set[str], set[str]]]:
+    """Migrate the contents of each partition.
+
+    Partitions are migrated to separate directories and the work is bound by
+    filesystem I/O, so multiple partitions are migrated concurrently.
+
+    :param migrate: The function that migrates the contents of a partition and
+        returns the migrated files and directories.
+    :param partitions: The partitions to migrate, in order.
+
+    :returns: A mapping of partition names to migrated files and directories,
+        in the same order as the partitions.
+    """
+    if len(partitions) <= 1:
+        return {partition: migrate(partition) for partition in partitions}
+
+    max_workers = min(_MAX_MIGRATION_WORKERS, len(partitions))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            partition: executor.submit(migrate, partition) for partition in partitions
+        }
+
+    return {partition: future.result() for partition, future in futures.items()}
+
+
+def _recv_available(conn: socket.socket) -> tuple[bytes, bool]:
+    """Read all data currently available from a non-blocking connection.
+
+    :param conn: The connection to read from.
+
+    :returns: A tuple containing the data read and whether the peer closed
+        the connection.
+    """
+    chunks: list[bytes] = []
+    while True:
+        try:
+            chunk = conn.recv(_CTL_RECV_SIZE)
+        except BlockingIOError:
+            return b"".join(chunks), False
+        if not chunk:
+            return b"".join(chunks), True
+        chunks.append(chunk)
+
+
+def _is_complete_message(data: bytes) -> bool:
+    """Verify if unterminated data holds a complete ctl message.
+
+    :param data: The data received after the last message terminator.
+
+    :returns: Whether the data is a complete JSON object.
+    """
+    if not data.rstrip().endswith(b"}"):
+        return False
+
+    try:
+        json.loads(data)
+    except ValueError:
+        return False
+
+    return True
+
+
+def _send_reply(conn: socket.socket, data: bytes) -> None:
+    """Send a complete reply through a non-blocking connection.
+
+    The connection blocks while sending, so a reply larger than the socket
+    buffer waits for the client to read it instead of being cut short.
+
+    :param conn: The connection to send the reply through.
+    :param data: The reply to send.
+    """
+    conn.setblocking(True)  # noqa: FBT003
+    try:
+        conn.sendall(data)
+    finally:
+        conn.setblocking(False)  # noqa: FBT003
+
+
+def _write_if_changed(path: Path, content: str) -> None:
+    """Write content to a file unless it already has the same content.
+
+    Leaving an unchanged file alone preserves its modification time.
+
+    :param path: The file to write.
+    :param content: The content to write.
+    """
+    try:
+        if path.read_text() == content:
+            return
+    except (OSError, UnicodeDecodeError):
+        pass
+
+    path.write_text(content)
 
 
 def _create_and_run_script(
@@ -554,18 +685,15 @@ def _create_and_run_script(
     selector: selectors.BaseSelector | None = None,
 ) -> None:
     """Create a script with step-specific commands and execute it."""
-    with script_path.open("w") as run_file:
-        print("#!/bin/bash", file=run_file)
-        print("set -euo pipefail", file=run_file)
-
-        if environment_script_path:
-            print(f"source {environment_script_path}", file=run_file)
+    lines = ["#!/bin/bash", "set -euo pipefail"]
 
-        print("set -x", file=run_file)
+    if environment_script_path:
+        lines.append(f"source {environment_script_path}")
 
-        for cmd in commands:
-            print(cmd, file=run_file)
+    lines.append("set -x")
+    lines.extend(commands)
 
+    script_path.write_text("\n".join(lines) + "\n")
     script_path.chmod(0o755)
     logger.debug("Executing %r", script_path)
 
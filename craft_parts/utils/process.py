@@ -32,6 +32,12 @@ Stream = TextIO | int | None
 
 _BUF_SIZE = 4096
 
+# Interval to check for process exit when it can't be waited for in the selector.
+_POLL_TIMEOUT = 0.1
+
+# Selector data for the process exit file descriptor.
+_PROCESS_EXIT = object()
+
 # Compatibility with subprocess.DEVNULL
 DEVNULL = subprocess.DEVNULL
 
@@ -63,6 +69,7 @@ class _ProcessStream:
         # (Mostly) optimize away the process function if the read handle is empty
         if self.read_fd == DEVNULL:
             self.process = self._process_nothing  # type: ignore[method-assign]
+            self.drain = self._process_nothing  # type: ignore[method-assign]
 
     @property
     def singular(self) -> bytes:
@@ -73,7 +80,26 @@ class _ProcessStream:
 
         Does nothing if ``read_fd`` is DEVNULL.
         """
-        data = os.read(self.read_fd, _BUF_SIZE)
+        return self._forward(os.read(self.read_fd, _BUF_SIZE))
+
+    def drain(self) -> bytes:
+        """Forward all data currently available from ``self.read_fd``.
+
+        Reads until the stream is exhausted or has no more data ready, and returns
+        a copy of the forwarded data.
+        """
+        forwarded = bytearray()
+        while True:
+            try:
+                data = os.read(self.read_fd, _BUF_SIZE)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            forwarded += self._forward(data)
+        return bytes(forwarded)
+
+    def _forward(self, data: bytes) -> bytes:
         i = data.rfind(b"\n")
         if i >= 0:
             self._linebuf.extend(data[: i + 1])
@@ -143,31 +169,28 @@ def run(
     with (
         _select_stream(stdout, sys.stdout) as out_fd,
         _select_stream(stderr, sys.stderr) as err_fd,
+        _process_exit_fd(proc) as exit_fd,
     ):
         # Set up select library with any streams that need monitoring
-        selector = selector or selectors.SelectSelector()
+        own_selector = selector is None
+        selector = selector or selectors.DefaultSelector()
         out_handler = _get_stream_handler(proc.stdout, out_fd, selector)
         err_handler = _get_stream_handler(proc.stderr, err_fd, selector)
 
-        with closing(BytesIO()) as combined_io:
-            while True:
-                finished = proc.poll() is not None
-                try:
-                    # Time out if we don't have any event to handle
-                    for key, mask in selector.select(0.1):
-                        if isinstance(key.data, _ProcessStream):
-                            # Handle i/o stream processing.
-                            combined_io.write(key.data.process())
-                        else:
-                            # Generic handlers from caller selector.
-                            callback = key.data
-                            callback(key.fileobj, mask)
-                except BlockingIOError:
-                    pass
-
-                if finished:
-                    combined = combined_io.getvalue()
-                    break
+        # Wake up when the process exits instead of polling for it, if possible.
+        if exit_fd is not None:
+            selector.register(exit_fd, selectors.EVENT_READ, _PROCESS_EXIT)
+            timeout = None
+        else:
+            timeout = _POLL_TIMEOUT
+
+        try:
+            combined = _handle_events(proc, selector, timeout)
+        finally:
+            if own_selector:
+                selector.close()
+            elif exit_fd is not None:
+                selector.unregister(exit_fd)
 
     proc.wait()
 
@@ -188,6 +211,61 @@ def run(
     return result
 
 
+def _handle_events(
+    proc: subprocess.Popen[bytes],
+    selector: selectors.BaseSelector,
+    timeout: float | None,
+) -> bytes:
+    """Dispatch selector events until the process finishes.
+
+    :return: The combined output of the process streams.
+    """
+    with closing(BytesIO()) as combined_io:
+        while True:
+            finished = proc.poll() is not None
+            try:
+                # Handle any pending events once more after the process
+                # finishes, without waiting for new ones.
+                for key, mask in selector.select(0 if finished else timeout):
+                    if key.data is _PROCESS_EXIT:
+                        continue
+                    if isinstance(key.data, _ProcessStream):
+                        # Handle i/o stream processing, consuming all the
+                        # remaining output once the process has finished.
+                        stream = key.data
+                        combined_io.write(
+                            stream.drain() if finished else stream.process()
+                        )
+                    else:
+                        # Generic handlers from caller selector.
+                        callback = key.data
+                        callback(key.fileobj, mask)
+            except BlockingIOError:
+                pass
+
+            if finished:
+                return combined_io.getvalue()
+
+
+@contextmanager
+def _process_exit_fd(proc: subprocess.Popen[bytes]) -> Generator[int | None]:
+    """Open a file descriptor that becomes readable when the process exits.
+
+    Yields None if process file descriptors are not available on this platform,
+    in which case the caller must poll for the process to exit.
+    """
+    try:
+        exit_fd = os.pidfd_open(proc.pid)
+    except (AttributeError, OSError):
+        yield None
+        return
+
+    try:
+        yield exit_fd
+    finally:
+        os.close(exit_fd)
+
+
 @contextmanager
 def _select_stream(stream: Stream, default_stream: TextIO) -> Generator[int]:
     """Select and return an appropriate raw file descriptor.
@@ -206,6 +206,31 @@ def test_craftctl_set(new_dir, partitions):
     assert lf.project_info.get_project_var("myvar") == "myvalue"
 
 
+def test_craftctl_set_value_with_equals(new_dir, partitions):
+    parts_yaml = textwrap.dedent(
+        """\
+        parts:
+          foo:
+            plugin: nil
+            override-pull: |
+              craftctl set myvar=a=b
+        """
+    )
+    parts = yaml.safe_load(parts_yaml)
+
+    lf = craft_parts.LifecycleManager(
+        parts,
+        application_name="test_set",
+        cache_dir=new_dir,
+        project_vars_part_name="foo",
+        project_vars={"myvar": ""},
+        partitions=partitions,
+    )
+    with lf.action_executor() as ctx:
+        ctx.execute(Action("foo", Step.PULL))
+    assert lf.project_info.get_project_var("myvar") == "a=b"
+
+
 def test_craftctl_set_nested(new_dir, partitions):
     parts_yaml = textwrap.dedent(
         """\
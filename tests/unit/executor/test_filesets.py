@@ -14,6 +14,8 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+from pathlib import Path
+
 import pytest
 from craft_parts import errors
 from craft_parts.executor import Fileset, filesets
@@ -150,4 +152,36 @@ def test_filesets_excludes_without_relative_paths():
     assert raised.value.message == "path '/abs/exclude' must be relative."
 
 
+def test_get_resolved_relative_path_reuses_parents(new_dir):
+    Path("real/dir").mkdir(parents=True)
+    Path("link").symlink_to("real")
+    resolved_parents: dict[str, str] = {}
+
+    assert (
+        filesets._get_resolved_relative_path("link/dir", str(new_dir), resolved_parents)
+        == "real/dir"
+    )
+    assert resolved_parents == {"link": str(new_dir / "real")}
+
+    # a cached parent is reused without resolving it again
+    resolved_parents["link"] = str(new_dir / "other")
+    assert (
+        filesets._get_resolved_relative_path(
+            "link/file", str(new_dir), resolved_parents
+        )
+        == "other/file"
+    )
+
+
+def test_is_real_dir(new_dir):
+    Path("dir").mkdir()
+    Path("file").touch()
+    Path("dir_link").symlink_to("dir")
+
+    assert filesets._is_real_dir("dir") is True
+    assert filesets._is_real_dir("file") is False
+    assert filesets._is_real_dir("dir_link") is False
+    assert filesets._is_real_dir("missing") is False
+
+
 # migratable_filesets tested in tests/unit/executor/test_step_handler.py
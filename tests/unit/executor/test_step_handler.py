@@ -13,13 +13,19 @@
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import contextlib
 import itertools
 import os
+import selectors
+import socket
+import threading
+import time
 from pathlib import Path
 from textwrap import dedent
 
 import pytest
 from craft_parts import errors, plugins, sources
+from craft_parts.ctl import CraftCtl
 from craft_parts.dirs import ProjectDirs
 from craft_parts.executor.environment import generate_step_environment
 from craft_parts.executor.step_handler import (
@@ -27,11 +33,14 @@ from craft_parts.executor.step_handler import (
     StepContents,
     StepHandler,
     StepPartitionContents,
+    _migrate_partitions,
+    _recv_available,
 )
 from craft_parts.infos import (
     _DEB_TO_TRIPLET,
     PartInfo,
     ProjectInfo,
+    ProjectVarInfo,
     StepInfo,
     _get_host_architecture,
 )
@@ -241,6 +250,31 @@ class TestStepHandlerBuiltins:
         )
         assert result == StepContents()
 
+    def test_run_builtin_build_keeps_environment(self, new_dir, mocker):
+        mocker.patch("craft_parts.utils.process.run")
+
+        Path("parts/p1/run").mkdir(parents=True)
+        sh = _step_handler_for_step(
+            Step.BUILD,
+            cache_dir=new_dir,
+            part_info=self._part_info,
+            part=self._part,
+            dirs=self._dirs,
+        )
+        environment_script_path = Path(new_dir / "parts/p1/run/environment.sh")
+        sh.run_builtin()
+        os.utime(environment_script_path, ns=(0, 0))
+
+        # an unchanged environment script is not written again
+        sh.run_builtin()
+        assert environment_script_path.stat().st_mtime_ns == 0
+
+        # a modified environment script is rewritten
+        environment_script_path.write_text("modified")
+        sh.run_builtin()
+        assert environment_script_path.read_text() != "modified"
+        assert get_mode(environment_script_path) == 0o644
+
     def test_run_builtin_stage(self, new_dir, partitions):
         Path("parts/p1/install").mkdir(parents=True)
         Path("parts/p1/install/subdir").mkdir(parents=True)
@@ -307,6 +341,11 @@ class TestStepHandlerBuiltins:
 
         assert result == step_contents
 
+    def test_builtin_handlers(self):
+        assert set(StepHandler._BUILTIN_HANDLERS) == set(Step)
+        for handler_name in StepHandler._BUILTIN_HANDLERS.values():
+            assert callable(getattr(StepHandler, handler_name, None))
+
     def test_run_builtin_invalid(self, new_dir):
         sh = _step_handler_for_step(
             999,  # type: ignore[reportGeneralTypeIssues]
@@ -395,3 +434,162 @@ class TestStepHandlerRunScriptlet:
             )
         assert raised.value.stderr is not None
         assert raised.value.stderr.endswith(b"\nuh-oh\n+ false\n")
+
+
+@pytest.mark.parametrize("partitions", [["default"], ["default", "a", "b", "c"]])
+def test_migrate_partitions_order(partitions):
+    migrated = _migrate_partitions(lambda p: ({f"{p}/file"}, {p}), partitions)
+
+    assert list(migrated) == partitions
+    assert migrated == {p: ({f"{p}/file"}, {p}) for p in partitions}
+
+
+def test_migrate_partitions_error():
+    def migrate(partition: str) -> tuple[set[str], set[str]]:
+        if partition == "b":
+            raise errors.FileOrganizeError(part_name="foo", message="bad")
+        return set(), set()
+
+    with pytest.raises(errors.FileOrganizeError):
+        _migrate_partitions(migrate, ["default", "a", "b"])
+
+
+def test_recv_available():
+    server, client = socket.socketpair()
+    server.setblocking(False)
+    with server, client:
+        assert _recv_available(server) == (b"", False)
+
+        client.sendall(b"x" * 10000)
+        assert _recv_available(server) == (b"x" * 10000, False)
+
+        client.sendall(b"bye")
+        client.close()
+        assert _recv_available(server) == (b"bye", True)
+
+
+_GET_VERSION = b'{"function": "get", "args": ["version"]}'
+
+
+class TestStepHandlerCtlServer:
+    """Verify the ctl server."""
+
+    @pytest.fixture(autouse=True)
+    def setup(self, new_dir):
+        # pylint: disable=attribute-defined-outside-init
+        self._part = Part("p1", {"source": "."})
+        self._dirs = ProjectDirs()
+        self._project_info = ProjectInfo(
+            project_dirs=self._dirs,
+            application_name="test",
+            cache_dir=new_dir,
+            project_vars=ProjectVarInfo.unmarshal({"version": {"value": "1.0"}}),
+        )
+        self._part_info = PartInfo(project_info=self._project_info, part=self._part)
+        self._sh = _step_handler_for_step(
+            Step.BUILD,
+            cache_dir=new_dir,
+            part_info=self._part_info,
+            part=self._part,
+            dirs=self._dirs,
+        )
+        # pylint: enable=attribute-defined-outside-init
+
+    def _serve(self) -> tuple[socket.socket, selectors.BaseSelector]:
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind("ctl.socket")
+        server.listen()
+        return server, self._sh._ctl_server_selector(
+            Step.BUILD, "override-build", server
+        )
+
+    @pytest.mark.parametrize(
+        ("request_chunks", "response"),
+        [
+            # older clients send a single unterminated message
+            ([_GET_VERSION], b"OK 1.0\n"),
+            ([_GET_VERSION + b"\n"], b"OK 1.0\n"),
+            ([_GET_VERSION + b"\n" + _GET_VERSION + b"\n"], b"OK 1.0\nOK 1.0\n"),
+            # a message split across reads is buffered until it's complete
+            ([_GET_VERSION[:10], _GET_VERSION[10:] + b"\n"], b"OK 1.0\n"),
+            ([_GET_VERSION[:-1], _GET_VERSION[-1:]], b"OK 1.0\n"),
+            (
+                [_GET_VERSION + b"\n" + _GET_VERSION[:10], _GET_VERSION[10:] + b"\n"],
+                b"OK 1.0\nOK 1.0\n",
+            ),
+        ],
+    )
+    def test_messages(self, request_chunks, response):
+        server, selector = self._serve()
+
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect("ctl.socket")
+        client.setblocking(False)
+
+        received = b""
+        deadline = time.monotonic() + 10
+        with server, client, selector:
+            for chunk in request_chunks:
+                client.sendall(chunk)
+                for key, mask in selector.select(timeout=0.1):
+                    key.data(key.fileobj, mask)
+            while not received.endswith(response) and time.monotonic() < deadline:
+                for key, mask in selector.select(timeout=0.01):
+                    key.data(key.fileobj, mask)
+                with contextlib.suppress(BlockingIOError):
+                    received += client.recv(1024)
+
+        assert received == response
+
+    def test_messages_end_of_request(self):
+        server, selector = self._serve()
+
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.connect("ctl.socket")
+        client.sendall(_GET_VERSION + b"\n" + _GET_VERSION)
+        client.shutdown(socket.SHUT_WR)
+        client.setblocking(False)
+
+        # The unterminated message is handled when the client ends the request,
+        # and the connection is closed after the replies are sent.
+        received = b""
+        closed = False
+        deadline = time.monotonic() + 10
+        with server, client, selector:
+            while not closed and time.monotonic() < deadline:
+                for key, mask in selector.select(timeout=0.01):
+                    key.data(key.fileobj, mask)
+                with contextlib.suppress(BlockingIOError):
+                    chunk = client.recv(1024)
+                    closed = not chunk
+                    received += chunk
+
+        assert closed
+        assert received == b"OK 1.0\nOK 1.0\n"
+
+    def test_large_reply(self, new_dir, mocker):
+        # The reply doesn't fit in the socket buffer.
+        version = "1" * 4_000_000
+        self._project_info.set_project_var("version", version, raw_write=True)
+        server, selector = self._serve()
+        mocker.patch.dict(os.environ, {"PARTS_CTL_SOCKET": str(new_dir / "ctl.socket")})
+
+        retval: list[str | None] = []
+        client = threading.Thread(
+            target=lambda: retval.append(CraftCtl.run("get", ["version"])),
+            daemon=True,
+        )
+        client.start()
+
+        deadline = time.monotonic() + 30
+        with server, selector:
+            while client.is_alive() and time.monotonic() < deadline:
+                for key, mask in selector.select(timeout=0.1):
+                    key.data(key.fileobj, mask)
+
+        assert retval == [version]
+
+    @pytest.mark.parametrize("function_call", [b"{", b"\xff"])
+    def test_handle_control_api_invalid_json(self, function_call):
+        with pytest.raises(RuntimeError, match="called a function with invalid json"):
+            self._sh._handle_control_api(Step.BUILD, "override-build", function_call)
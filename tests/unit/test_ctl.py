@@ -28,15 +28,19 @@ class _FakeSocket:
     def listen(self, n: int):
         pass
 
-    def send(self, data: bytes) -> None:
+    def sendall(self, data: bytes) -> None:
         self.data = data
 
     def recv(self, n: int) -> bytes:
-        return self._buffer
+        data, self._buffer = self._buffer[:n], self._buffer[n:]
+        return data
 
     def connect(self, path: str):
         pass
 
+    def shutdown(self, how: int) -> None:
+        pass
+
 
 class TestClient:
     """Verify the ctl client."""
@@ -48,7 +52,7 @@ class TestClient:
 
         CraftCtl.run("default", ["whatever"])
 
-        assert fake_socket.data == b'{"function": "default", "args": ["whatever"]}'
+        assert fake_socket.data == b'{"function": "default", "args": ["whatever"]}\n'
 
     def test_call_command_with_ok_feedback(self, new_dir, mocker):
         fake_socket = _FakeSocket(b"OK hello there!")
@@ -59,6 +63,16 @@ class TestClient:
 
         assert retval == "hello there!"
 
+    def test_call_command_with_multiline_feedback(self, new_dir, mocker):
+        fake_socket = _FakeSocket(b"ERR hello\nthere!\n")
+        mocker.patch("socket.socket", return_value=fake_socket)
+        mocker.patch.dict(os.environ, {"PARTS_CTL_SOCKET": "fake"})
+
+        with pytest.raises(RuntimeError) as raised:
+            CraftCtl.run("default", ["whatever"])
+
+        assert str(raised.value) == "hello\nthere!"
+
     def test_call_command_with_error_feedback(self, new_dir, mocker):
         fake_socket = _FakeSocket(b"ERR hello there!")
         mocker.patch("socket.socket", return_value=fake_socket)
@@ -14,9 +14,12 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import pickle
 from typing import TYPE_CHECKING
 
+import pytest
 from craft_parts import errors
+from craft_parts.sources.errors import InvalidSourceType
 
 if TYPE_CHECKING:
     from pydantic.error_wrappers import ErrorDict
@@ -46,6 +49,75 @@ def test_parts_error_full():
     assert err.resolution == "Resolution"
 
 
+@pytest.mark.parametrize(
+    ("details", "resolution", "expected"),
+    [
+        (None, None, "Brief"),
+        ("", "", "Brief"),
+        ("Details", None, "Brief\nDetails"),
+        (None, "Resolution", "Brief\nResolution"),
+        ("Details", "Resolution", "Brief\nDetails\nResolution"),
+    ],
+)
+def test_parts_error_str(details, resolution, expected):
+    err = errors.PartsError(brief="Brief", details=details, resolution=resolution)
+    assert str(err) == expected
+
+
+def test_parts_error_str_cached():
+    err = errors.PartsError(brief="Brief", details="Details", resolution="Resolution")
+    message = str(err)
+    assert str(err) is message
+
+
+def test_parts_error_repr_cached():
+    err = errors.PartsError(brief="Brief", details="Details", resolution="Resolution")
+    representation = repr(err)
+    assert repr(err) is representation
+
+
+@pytest.mark.parametrize("field", ["brief", "details", "resolution", "doc_slug"])
+def test_parts_error_field_set(field):
+    err = errors.PartsError(brief="Brief", details="Details", resolution="Resolution")
+    assert "Changed" not in str(err)
+    assert "Changed" not in repr(err)
+
+    setattr(err, field, "Changed")
+    if field != "doc_slug":
+        assert "Changed" in str(err)
+    assert "Changed" in repr(err)
+
+
+def test_parts_error_slots():
+    err = errors.PartSpecificationError(part_name="foo", message="something is wrong")
+    # Attributes live in slots, so the instance dictionary stays empty.
+    assert err.__dict__ == {}
+
+
+@pytest.mark.parametrize(
+    "err",
+    [
+        errors.PartsError(brief="Brief", details="Details", resolution="Resolution"),
+        errors.FeatureError("bummer"),
+        errors.PartSpecificationError(part_name="foo", message="something is wrong"),
+        errors.ScriptletRunError(
+            part_name="foo",
+            scriptlet_name="override-build",
+            exit_code=42,
+            stderr=b"+ cmd\nerror\n",
+        ),
+        InvalidSourceType("foo", source_type="bar"),
+    ],
+)
+def test_parts_error_pickle(err):
+    new_err = pickle.loads(pickle.dumps(err))  # noqa: S301
+    assert type(new_err) is type(err)
+    assert new_err.args == err.args
+    assert repr(new_err) == repr(err)
+    assert str(new_err) == str(err)
+    assert new_err.__dict__ == err.__dict__
+
+
 def test_part_dependency_cycle():
     err = errors.PartDependencyCycle()
     assert err.brief == "A circular dependency chain was detected."
@@ -99,6 +171,7 @@ def test_invalid_architecture():
 def test_part_specification_error():
     err = errors.PartSpecificationError(part_name="foo", message="something is wrong")
     assert err.part_name == "foo"
+    assert err.message == "something is wrong"
     assert err.brief == "Part 'foo' validation failed."
     assert err.details == "something is wrong"
     assert err.resolution == "Review part 'foo' and make sure it's correct."
@@ -127,6 +200,19 @@ def test_part_specification_error_from_validation_error() -> None:
     assert err.resolution == "Review part 'foo' and make sure it's correct."
 
 
+@pytest.mark.parametrize(
+    ("loc", "expected"),
+    [
+        (("field",), "field"),
+        (("field", 0), "field[0]"),
+        (("field", 0, 1, "sub"), "field[0][1].sub"),
+        (("field", "__root__"), "field"),
+    ],
+)
+def test_format_loc(loc, expected):
+    assert errors._format_loc(loc) == expected
+
+
 def test_copy_tree_error():
     err = errors.CopyTreeError("something bad happened")
     assert err.message == "something bad happened"
@@ -232,6 +318,14 @@ def test_fileset_conflict():
     )
 
 
+def test_fileset_conflict_sorted():
+    err = errors.FilesetConflict({"foo", "bar", "baz"})
+    assert err.details == (
+        "The following files have been excluded in the 'stage' fileset, "
+        "but included by the 'prime' fileset: {'bar', 'baz', 'foo'}."
+    )
+
+
 def test_file_organize_error():
     err = errors.FileOrganizeError(part_name="foo", message="not ready reading drive A")
     assert err.part_name == "foo"
@@ -241,6 +335,18 @@ def test_file_organize_error():
     assert err.resolution is None
 
 
+@pytest.mark.parametrize(
+    ("file_names", "expected"),
+    [
+        ([], ""),
+        (["file1"], "    file1"),
+        (["file2", "dir/file3", "file1"], "    dir/file3\n    file1\n    file2"),
+    ],
+)
+def test_format_file_list(file_names, expected):
+    assert errors._format_file_list(file_names) == expected
+
+
 def test_part_files_conflict():
     err = errors.PartFilesConflict(
         part_name="foo", other_part_name="bar", conflicting_files=["file1", "file2"]
@@ -328,6 +434,48 @@ def test_plugin_build_error():
     assert err.doc_slug == "/reference/plugins/"
 
 
+@pytest.mark.parametrize(
+    ("stderr", "expected"),
+    [
+        (b"", ""),
+        (b"error\n", "\n:: error"),
+        (b"+ cmd1\n+ cmd2\n+ cmd3\n", "\n:: + cmd1\n:: + cmd2\n:: + cmd3"),
+        (
+            b"+ cmd1\nout1\n\n+ cmd2\nerror\n",
+            "\n:: + cmd1\n:: out1\n:: + cmd2\n:: error",
+        ),
+        (
+            b"+ cmd1\n+ cmd2\nout2\n+ cmd3\n+ cmd4\nerror\n",
+            "\n:: + cmd2\n:: out2\n:: + cmd3\n:: + cmd4\n:: error",
+        ),
+        (b"+ caf\xc3\xa9\n\xff\n", "\n:: + caf\u00e9\n:: \ufffd"),
+    ],
+)
+def test_plugin_build_error_details(stderr, expected):
+    err = errors.PluginBuildError(part_name="foo", plugin_name="go", stderr=stderr)
+    assert err.details == expected
+
+
+def test_plugin_build_error_details_cached():
+    err = errors.PluginBuildError(
+        part_name="foo", plugin_name="go", stderr=b"+ cmd\nerror\n"
+    )
+    details = err.details
+    assert err.details is details
+
+
+def test_plugin_build_error_details_set():
+    err = errors.PluginBuildError(
+        part_name="foo", plugin_name="go", stderr=b"+ cmd\nerror\n"
+    )
+    assert "error" in str(err)
+    assert "error" in repr(err)
+
+    err.details = "new details"
+    assert "new details" in str(err)
+    assert "new details" in repr(err)
+
+
 def test_invalid_control_api_call():
     err = errors.InvalidControlAPICall(
         part_name="foo", scriptlet_name="override-build", message="everything is broken"
@@ -450,3 +598,43 @@ class TestPartitionErrors:
             "Wrap the partition name in parentheses, for example "
             "'default/file' should be written as '(default)/file'"
         )
+
+
+def test_filesystem_mount_error_from_validation_error() -> None:
+    error_list: list[ErrorDict] = [
+        {
+            "loc": ("default", 0, "mount"),
+            "msg": "something is wrong",
+            "type": "value_error",
+        },
+        {"loc": (), "msg": "field required", "type": "value_error"},
+        {"loc": ("field",), "msg": "", "type": "value_error"},
+    ]
+    err = errors.FilesystemMountError.from_validation_error(error_list=error_list)
+    assert err.brief == "Filesystem validation failed."
+    assert err.details == (
+        "- something is wrong in field 'default[0].mount'\n- field '' is required"
+    )
+    assert err.resolution is None
+
+
+@pytest.mark.parametrize(
+    ("unsupported", "brief", "resolution"),
+    [
+        (
+            {"foo"},
+            "Plugin 'nil' does not support the 'foo' build attribute.",
+            "Remove the build attribute, or use a different plugin.",
+        ),
+        (
+            {"foo", "bar"},
+            "Plugin 'nil' does not support the 'bar' and 'foo' build attributes.",
+            "Remove the build attributes, or use a different plugin.",
+        ),
+    ],
+)
+def test_unsupported_build_attributes_error(unsupported, brief, resolution):
+    err = errors.UnsupportedBuildAttributesError(unsupported, "nil")
+    assert err.brief == brief
+    assert err.details is None
+    assert err.resolution == resolution
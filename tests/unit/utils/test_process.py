@@ -91,3 +91,18 @@ def test_run_selector(out, err, new_dir):
     assert result.stderr == (err + "\n").encode()
     assert result.combined == (out + "\n" + err + "\n").encode()
     assert message == ([out] if out else [])
+
+
+def test_run_large_output():
+    # Output still buffered in the pipe when the process exits is not lost.
+    result = process.run(["/usr/bin/sh", "-c", "seq 1 100000"], stderr=process.DEVNULL)
+    assert result.stdout.endswith(b"\n99999\n100000\n")
+    assert len(result.stdout.splitlines()) == 100000
+
+
+def test_run_without_pidfd(mocker):
+    mocker.patch("os.pidfd_open", side_effect=OSError, create=True)
+    result = process.run(["/usr/bin/sh", "-c", "echo hello;sleep 0.1;echo bye >&2"])
+    assert result.returncode == 0
+    assert result.stdout == b"hello\n"
+    assert result.stderr == b"bye\n"